@@ -7,6 +7,7 @@ Handles text generation using llama.cpp or Ollama with TinyLlama/Phi-3 models.
 import asyncio
 import logging
 import subprocess
+import threading
 import json
 import requests
 from pathlib import Path
@@ -69,7 +70,26 @@ class LLMEngine:
             return None
         
         return await self.backend.generate(prompt, max_tokens)
-    
+
+    async def generate_stream(self, prompt: str, max_tokens: int = 256):
+        """Stream generated text incrementally.
+
+        Yields text fragments as the backend produces them. Backends
+        without native streaming (llama.cpp CLI) yield the full response
+        once it is complete.
+        """
+        if not self.is_initialized:
+            logger.error("LLM not initialized")
+            return
+
+        if hasattr(self.backend, 'generate_stream'):
+            async for chunk in self.backend.generate_stream(prompt, max_tokens):
+                yield chunk
+        else:
+            text = await self.backend.generate(prompt, max_tokens)
+            if text:
+                yield text
+
     def cleanup(self):
         """Clean up resources."""
         if self.backend:
@@ -156,7 +176,57 @@ class OllamaLLM:
         except Exception as e:
             logger.error(f"Error generating with Ollama: {e}")
             return None
-    
+
+    async def generate_stream(self, prompt: str, max_tokens: int = 256):
+        """Stream generated text fragments from Ollama as they arrive."""
+        data = {
+            "model": self.model_name,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": config.llm.temperature,
+                "top_p": 0.9,
+                "stop": ["Human:", "Assistant:", "\\n\\n"]
+            }
+        }
+
+        # The blocking HTTP read runs on a thread that feeds an asyncio
+        # queue; the coroutine yields fragments as they land
+        queue: asyncio.Queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        def _reader():
+            try:
+                response = requests.post(
+                    f"{self.base_url}/api/generate",
+                    json=data,
+                    stream=True,
+                    timeout=30
+                )
+
+                if response.status_code != 200:
+                    logger.error(f"Ollama generation failed: {response.text}")
+                else:
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = json.loads(line).get('response', '')
+                        if chunk:
+                            loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except Exception as e:
+                logger.error(f"Error streaming with Ollama: {e}")
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        threading.Thread(target=_reader, daemon=True, name="ollama-stream").start()
+
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            yield chunk
+
     def cleanup(self):
         """Clean up Ollama resources."""
         logger.info("Ollama cleanup complete")
@@ -5,19 +5,42 @@ Handles real-time speech transcription with optimized Whisper models.
 """
 
 import asyncio
+import functools
 import logging
+import shutil
+import struct
 import subprocess
 import tempfile
-import wave
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any
-import pyaudio
 
 from .config import config
 
 logger = logging.getLogger(__name__)
 
+# Prebuilt 44-byte WAV header for the fixed capture format
+# (16 kHz, mono, 16-bit signed little-endian). Only the two chunk-length
+# fields vary per recording, so they are patched in at write time.
+_WAV_HEADER_TEMPLATE = (
+    b"RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00"
+    b"\x80\x3e\x00\x00\x00\x7d\x00\x00\x02\x00\x10\x00data\x00\x00\x00\x00"
+)
+
+
+# Model/binary combinations already verified by a successful initialize().
+# Repeated WhisperSTT instances (e.g. the model-comparison test iterating
+# tiny/small) skip the existence checks and the binary test subprocess.
+_VERIFIED_PATHS = set()
+
+
+def _wav_bytes(pcm: bytes) -> bytes:
+    """Wrap raw S16LE mono 16 kHz PCM samples in a WAV container."""
+    header = bytearray(_WAV_HEADER_TEMPLATE)
+    struct.pack_into("<I", header, 4, 36 + len(pcm))
+    struct.pack_into("<I", header, 40, len(pcm))
+    return bytes(header) + pcm
+
 
 class WhisperSTT:
     """Speech-to-Text using Whisper.cpp for Pi-Jarvis."""
@@ -31,9 +54,9 @@ class WhisperSTT:
         self.model_name = model_name
         self.model_path = Path(f"models/ggml-{model_name}.bin")
         self.whisper_binary = Path("models/whisper.cpp/build/bin/whisper-cli")
-        self.audio = None
         self.is_recording = False
-        
+        self._tmpdir = None
+
         logger.info(f"Initializing WhisperSTT with model: {model_name}")
     
     def initialize(self) -> bool:
@@ -43,6 +66,16 @@ class WhisperSTT:
             True if initialization successful, False otherwise
         """
         try:
+            # Reusable scratch directory for recordings
+            if self._tmpdir is None:
+                self._tmpdir = tempfile.mkdtemp(prefix="parvis-stt-")
+
+            # Skip re-verification if this model/binary pair already passed
+            cache_key = (str(self.model_path), str(self.whisper_binary))
+            if cache_key in _VERIFIED_PATHS:
+                logger.info(f"WhisperSTT model '{self.model_name}' already verified")
+                return True
+
             # Check if model exists
             if not self.model_path.exists():
                 logger.error(f"Model not found: {self.model_path}")
@@ -52,17 +85,15 @@ class WhisperSTT:
             if not self.whisper_binary.exists():
                 logger.error(f"Whisper binary not found: {self.whisper_binary}")
                 return False
-            
-            # Initialize PyAudio
-            self.audio = pyaudio.PyAudio()
-            
+
             # Test Whisper binary
-            result = subprocess.run([str(self.whisper_binary), "--help"], 
+            result = subprocess.run([str(self.whisper_binary), "--help"],
                                   capture_output=True, text=True, timeout=5)
             if result.returncode != 0:
                 logger.error("Whisper binary test failed")
                 return False
-            
+
+            _VERIFIED_PATHS.add(cache_key)
             logger.info("WhisperSTT initialized successfully")
             return True
             
@@ -81,11 +112,12 @@ class WhisperSTT:
             Path to recorded WAV file or None if failed
         """
         try:
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-            temp_path = temp_file.name
-            temp_file.close()
-            
+            # Reuse a fixed path in our scratch directory instead of creating
+            # a fresh temp file per utterance (arecord truncates it each time)
+            if self._tmpdir is None:
+                self._tmpdir = tempfile.mkdtemp(prefix="parvis-stt-")
+            temp_path = os.path.join(self._tmpdir, "rec.wav")
+
             logger.info(f"Recording {duration} seconds of audio...")
             
             # Record audio using arecord (more reliable than PyAudio for Pi)
@@ -102,7 +134,8 @@ class WhisperSTT:
             
             if result.returncode != 0:
                 logger.error(f"Recording failed: {result.stderr}")
-                os.unlink(temp_path)
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
                 return None
             
             # Verify file was created and has content
@@ -117,12 +150,12 @@ class WhisperSTT:
             logger.error(f"Error recording audio: {e}")
             return None
     
-    def transcribe_file(self, audio_file: str) -> Optional[str]:
+    async def transcribe_file(self, audio_file: str) -> Optional[str]:
         """Transcribe audio file using Whisper.cpp.
-        
+
         Args:
             audio_file: Path to WAV audio file
-            
+
         Returns:
             Transcribed text or None if failed
         """
@@ -130,47 +163,94 @@ class WhisperSTT:
             if not os.path.exists(audio_file):
                 logger.error(f"Audio file not found: {audio_file}")
                 return None
-            
+
             logger.info(f"Transcribing audio file: {audio_file}")
             
-            # Run Whisper.cpp CLI
+            # Run Whisper.cpp CLI with Pi-optimized decoding settings
             cmd = [
                 str(self.whisper_binary),
                 "-m", str(self.model_path),
                 "-f", audio_file,
-                "--output-txt",  # Output as text
+                "-t", str(os.cpu_count() or 4),  # Use all available cores
+                "-bs", "1",      # Greedy decode (skip beam search)
+                "-bo", "1",      # Single best-of candidate
+                "-nt",           # No timestamps
+                "-l", config.stt.language,  # Skip language auto-detect
                 "--no-prints"    # Reduce verbose output
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode != 0:
-                logger.error(f"Whisper transcription failed: {result.stderr}")
+            # Run asynchronously so the event loop stays free during transcription
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                logger.error("Whisper transcription timed out")
                 return None
-            
-            # Read transcription result
-            # Whisper.cpp creates a .txt file alongside the input
-            txt_file = audio_file.replace(".wav", ".txt")
-            if os.path.exists(txt_file):
-                with open(txt_file, 'r', encoding='utf-8') as f:
-                    text = f.read().strip()
-                
-                # Clean up temp files
-                os.unlink(txt_file)
-                
-                logger.info(f"Transcription result: '{text}'")
-                return text
-            else:
-                logger.error("Transcription output file not found")
+
+            if proc.returncode != 0:
+                logger.error(f"Whisper transcription failed: {stderr.decode()}")
                 return None
-                
-        except subprocess.TimeoutExpired:
-            logger.error("Whisper transcription timed out")
-            return None
+            
+            # Transcription arrives on stdout (no --output-txt side file,
+            # which also avoids an extra SD-card write per utterance)
+            text = stdout.decode('utf-8').strip()
+
+            logger.info(f"Transcription result: '{text}'")
+            return text
+
         except Exception as e:
             logger.error(f"Error transcribing audio: {e}")
             return None
     
+    async def transcribe_pcm(self, pcm_bytes: bytes) -> Optional[str]:
+        """Transcribe raw PCM audio (16 kHz, mono, S16LE).
+
+        Useful for audio captured from an in-process stream (e.g. the
+        hot-word detector) without going through arecord.
+
+        Args:
+            pcm_bytes: Raw PCM sample bytes
+
+        Returns:
+            Transcribed text or None if failed
+        """
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.mkdtemp(prefix="parvis-stt-")
+
+        wav_path = os.path.join(self._tmpdir, "pcm.wav")
+        with open(wav_path, 'wb') as f:
+            f.write(_wav_bytes(pcm_bytes))
+
+        return await self.transcribe_file(wav_path)
+
+    async def prewarm(self) -> bool:
+        """Load and warm the model before the first real utterance.
+
+        Whisper.cpp reloads the model file on every CLI invocation, so the
+        first transcription otherwise pays the cold page-cache read of the
+        model (~100-500ms on SD card). Running one dummy transcription of
+        silence pulls the model and binary into the OS page cache so the
+        first real utterance runs at steady-state speed.
+
+        Returns:
+            True if the warmup transcription ran, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(None, self.initialize):
+            return False
+
+        # One second of 16 kHz mono silence
+        await self.transcribe_pcm(b"\x00\x00" * 16000)
+        logger.info("WhisperSTT prewarm complete")
+        return True
+
     async def transcribe_speech(self, duration: int = 5) -> Optional[str]:
         """Record and transcribe speech.
         
@@ -186,9 +266,8 @@ class WhisperSTT:
             return None
         
         try:
-            # Transcribe in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            text = await loop.run_in_executor(None, self.transcribe_file, audio_file)
+            # Transcription subprocess runs asynchronously - no executor needed
+            text = await self.transcribe_file(audio_file)
             return text
         finally:
             # Clean up audio file
@@ -197,10 +276,16 @@ class WhisperSTT:
     
     def cleanup(self):
         """Clean up resources."""
-        if self.audio:
-            self.audio.terminate()
-            logger.info("PyAudio terminated")
+        if self._tmpdir:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
 
+@functools.lru_cache(maxsize=1)
+def get_stt_engine() -> WhisperSTT:
+    """Get the shared STT engine, creating it on first use.
 
-# Global STT instance
-stt_engine = WhisperSTT(model_name="tiny")  # Start with tiny model for speed
\ No newline at end of file
+    Returns:
+        The process-wide WhisperSTT instance (tiny model for speed)
+    """
+    return WhisperSTT(model_name="tiny")
\ No newline at end of file
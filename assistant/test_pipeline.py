@@ -6,6 +6,7 @@ Phase 4: End-to-end STT → LLM → TTS testing
 import asyncio
 import logging
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add project root to path
@@ -69,28 +70,29 @@ async def test_multiple_conversation_turns(pipeline: SpeechPipeline):
         "Thank you for your help"
     ]
     
-    successful_turns = 0
-    total_time = 0
-    
-    for i, test_input in enumerate(test_inputs, 1):
+    # Single-pass aggregation: one Counter updated per turn, no re-scans.
+    # asyncio tasks share a thread, so in-place updates are race-free.
+    stats = Counter()
+
+    # Submit all five inputs as one batch instead of serial turns
+    turns = await pipeline.process_voice_inputs_batch(test_inputs)
+
+    for i, (test_input, turn) in enumerate(zip(test_inputs, turns), 1):
         print(f"\n--- Turn {i}/5 ---")
         print(f"👤 Simulated input: '{test_input}'")
-        
-        turn = await pipeline.process_voice_input(simulate_text=test_input)
-        
+
         if turn.success:
             print(f"🤖 Response: '{turn.assistant_text}'")
             print(f"⏱️  Time: {turn.total_time:.2f}s")
-            successful_turns += 1
-            total_time += turn.total_time
+            stats.update(successful=1, total_time=turn.total_time)
         else:
             print(f"❌ Turn failed: {turn.error_message}")
-    
+
     print(f"\n📊 Multi-turn Results:")
-    print(f"   Successful: {successful_turns}/5 turns")
-    print(f"   Average time: {total_time/max(successful_turns, 1):.2f}s per turn")
-    
-    return successful_turns >= 4  # At least 4/5 should succeed
+    print(f"   Successful: {stats['successful']}/5 turns")
+    print(f"   Average time: {stats['total_time']/max(stats['successful'], 1):.2f}s per turn")
+
+    return stats['successful'] >= 4  # At least 4/5 should succeed
 
 
 async def test_conversation_loop(pipeline: SpeechPipeline):
@@ -146,25 +148,27 @@ async def test_different_pipeline_modes():
     ]
     
     results = {}
-    
+
+    # Initialize once and hot-swap modes; models stay loaded across modes
+    pipeline = SpeechPipeline(mode=modes_to_test[0][0])
+    init_success = await pipeline.initialize()
+
+    if not init_success:
+        print("❌ Pipeline initialization failed - cannot test modes")
+        return False
+
     for mode, description in modes_to_test:
         print(f"\n--- Testing {description} ---")
-        
-        pipeline = SpeechPipeline(mode=mode)
-        init_success = await pipeline.initialize()
-        
-        if init_success:
-            turn = await pipeline.process_voice_input(
-                simulate_text="Hello, this is a mode test"
-            )
-            results[mode] = turn.success
-            print(f"✅ {description}: {'Working' if turn.success else 'Failed'}")
-        else:
-            results[mode] = False
-            print(f"❌ {description}: Initialization failed")
-        
-        pipeline.cleanup()
-    
+
+        pipeline.set_mode(mode)
+        turn = await pipeline.process_voice_input(
+            simulate_text="Hello, this is a mode test"
+        )
+        results[mode] = turn.success
+        print(f"✅ {description}: {'Working' if turn.success else 'Failed'}")
+
+    pipeline.cleanup()
+
     working_modes = sum(1 for success in results.values() if success)
     print(f"\n📋 Mode Testing Results: {working_modes}/{len(modes_to_test)} modes working")
     
@@ -179,36 +183,44 @@ async def main():
     print("=" * 55)
     
     test_results = []
+    summary = Counter()  # Updated as each result lands - no final re-scan
     pipeline = None
-    
+
+    def record(test_name, success):
+        test_results.append((test_name, success))
+        summary.update(total=1, passed=1 if success else 0)
+
     try:
         # Test 1: Pipeline Initialization
         pipeline = await test_pipeline_initialization()
-        test_results.append(("Pipeline Initialization", pipeline is not None))
+        record("Pipeline Initialization", pipeline is not None)
         
         if not pipeline:
             print("\n❌ Cannot proceed - pipeline initialization failed")
             return
         
-        # Test 2: Single Conversation Turn
-        single_turn_success = await test_single_conversation_turn(pipeline)
-        test_results.append(("Single Conversation Turn", single_turn_success))
-        
-        # Test 3: Multiple Conversation Turns
-        multi_turn_success = await test_multiple_conversation_turns(pipeline)
-        test_results.append(("Multiple Conversation Turns", multi_turn_success))
-        
-        # Test 4: Conversation Loop
-        loop_success = await test_conversation_loop(pipeline)
-        test_results.append(("Conversation Loop", loop_success))
-        
-        # Test 5: Performance Monitoring
-        perf_success = await test_performance_monitoring(pipeline)
-        test_results.append(("Performance Monitoring", perf_success))
-        
+        # Tests 2-5 are independent once the pipeline is initialized - run
+        # them concurrently so their turns overlap on the event loop
+        concurrent_tests = [
+            ("Single Conversation Turn", test_single_conversation_turn(pipeline)),
+            ("Multiple Conversation Turns", test_multiple_conversation_turns(pipeline)),
+            ("Conversation Loop", test_conversation_loop(pipeline)),
+            ("Performance Monitoring", test_performance_monitoring(pipeline)),
+        ]
+
+        outcomes = await asyncio.gather(
+            *(coro for _, coro in concurrent_tests),
+            return_exceptions=True
+        )
+
+        for (test_name, _), outcome in zip(concurrent_tests, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"❌ {test_name} raised: {outcome}")
+            record(test_name, outcome is True)
+
         # Test 6: Different Pipeline Modes
         modes_success = await test_different_pipeline_modes()
-        test_results.append(("Pipeline Modes", modes_success))
+        record("Pipeline Modes", modes_success)
         
         # Summary
         print("\n" + "=" * 55)
@@ -219,9 +231,9 @@ async def main():
             status = "✅ PASS" if success else "❌ FAIL"
             print(f"{status} {test_name}")
         
-        passed_tests = sum(1 for _, success in test_results if success)
-        total_tests = len(test_results)
-        
+        passed_tests = summary['passed']
+        total_tests = summary['total']
+
         print(f"\n📊 Overall Results: {passed_tests}/{total_tests} tests passed")
         
         if passed_tests >= 5:  # At least 5/6 tests should pass
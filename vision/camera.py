@@ -6,9 +6,12 @@ Handles camera capture and image processing for vision analysis.
 Supports both real Pi Camera and simulation modes.
 """
 
+import io
 import logging
+import threading
 import time
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List
 from pathlib import Path
 import tempfile
@@ -28,11 +31,30 @@ try:
 except ImportError:
     PICAMERA_AVAILABLE = False
 
+try:
+    # libjpeg-turbo bindings (NEON-accelerated DCT/Huffman on ARM)
+    from turbojpeg import TurboJPEG
+    _TURBOJPEG = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except Exception:
+    _TURBOJPEG = None
+    TURBOJPEG_AVAILABLE = False
+
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 logger = logging.getLogger(__name__)
 
+# Shared bounded pool for blocking camera calls. The default asyncio
+# executor grows unbounded under burst load; two workers are enough for
+# capture + encode without thrashing the Pi.
+_CAM_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cam")
+
+
+def shutdown_camera_pool():
+    """Shut down the shared camera thread pool."""
+    _CAM_POOL.shutdown(wait=False)
+
 
 class PiCameraInterface:
     """Interface for Pi Camera v3 capture."""
@@ -43,20 +65,20 @@ class PiCameraInterface:
         self.is_initialized = False
         logger.info("Initializing Pi Camera interface")
     
-    def initialize(self) -> bool:
+    async def initialize(self) -> bool:
         """Initialize the Pi Camera.
-        
+
         Returns:
             True if initialization successful, False otherwise
         """
         if not PICAMERA_AVAILABLE:
             logger.error("picamera2 not available - install with: pip install picamera2")
             return False
-        
+
         try:
             logger.info("Initializing Pi Camera v3...")
             self.camera = Picamera2()
-            
+
             # Configure camera
             config = self.camera.create_still_configuration(
                 main={"size": (1920, 1080)},  # Full HD
@@ -64,11 +86,13 @@ class PiCameraInterface:
                 display="lores"
             )
             self.camera.configure(config)
-            
-            # Start camera
-            self.camera.start()
-            time.sleep(2)  # Allow camera to warm up
-            
+
+            # Start the camera off the event loop, then let auto-exposure
+            # settle without blocking concurrent initializers
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.camera.start)
+            await asyncio.sleep(2)  # Allow camera to warm up
+
             self.is_initialized = True
             logger.info("✅ Pi Camera initialized successfully")
             return True
@@ -96,15 +120,18 @@ class PiCameraInterface:
                 temp_fd, output_path = tempfile.mkstemp(suffix='.jpg', prefix='parvis_capture_')
                 os.close(temp_fd)
             
-            logger.info(f"Capturing image to: {output_path}")
-            
-            # Capture image
-            self.camera.capture_file(output_path)
-            
+            logger.info("Capturing image to: %s", output_path)
+
+            # Capture image (blocking C call, keep it off the event loop)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_CAM_POOL, self.camera.capture_file, output_path)
+
             # Verify file was created
             if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                logger.info(f"✅ Image captured successfully ({file_size} bytes)")
+                # Only stat the file when the message will actually be emitted
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("✅ Image captured successfully (%d bytes)",
+                                os.path.getsize(output_path))
                 return output_path
             else:
                 logger.error("❌ Image capture failed - file not created")
@@ -113,7 +140,81 @@ class PiCameraInterface:
         except Exception as e:
             logger.error(f"Error capturing image: {e}")
             return None
-    
+
+    async def capture_bytes(self) -> Optional[bytes]:
+        """Capture a JPEG-encoded frame without touching the filesystem.
+
+        Returns:
+            JPEG bytes, or None if capture failed
+        """
+        if not self.is_initialized or not self.camera:
+            logger.error("Pi Camera not initialized")
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+            array = await loop.run_in_executor(_CAM_POOL, self.camera.capture_array, "main")
+            return await loop.run_in_executor(_CAM_POOL, _encode_jpeg, array)
+        except Exception as e:
+            logger.error(f"Error capturing image bytes: {e}")
+            return None
+
+    async def capture_ndarray(self) -> Optional["np.ndarray"]:
+        """Capture a decoded frame array without JPEG encoding or disk I/O.
+
+        Returns:
+            RGB frame array, or None if capture failed
+        """
+        if not self.is_initialized or not self.camera:
+            logger.error("Pi Camera not initialized")
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_CAM_POOL, self.camera.capture_array, "main")
+        except Exception as e:
+            logger.error(f"Error capturing frame array: {e}")
+            return None
+
+    async def capture_lowres_bytes(self, grayscale: bool = False) -> Optional[bytes]:
+        """Capture from the already-configured 640x480 lores stream.
+
+        Detection models downscale their input anyway, so pulling the
+        lores stream skips the full-HD sensor readout entirely. The lores
+        stream is YUV420, so grayscale output is just the Y plane - no
+        color conversion needed.
+
+        Args:
+            grayscale: Encode only the luma plane (smaller JPEG, no color)
+
+        Returns:
+            JPEG bytes, or None if capture failed
+        """
+        if not self.is_initialized or not self.camera:
+            logger.error("Pi Camera not initialized")
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+            yuv = await loop.run_in_executor(_CAM_POOL, self.camera.capture_array, "lores")
+
+            if grayscale:
+                # YUV420 planar: the first `height` rows are the Y plane
+                gray = np.ascontiguousarray(yuv[:480, :640])
+                return await loop.run_in_executor(_CAM_POOL, _encode_jpeg_gray, gray)
+
+            if OPENCV_AVAILABLE:
+                rgb = cv2.cvtColor(yuv, cv2.COLOR_YUV420p2RGB)
+            else:
+                # No cv2 for the chroma upsample - fall back to grayscale
+                rgb = np.ascontiguousarray(yuv[:480, :640])
+                return await loop.run_in_executor(_CAM_POOL, _encode_jpeg_gray, rgb)
+
+            return await loop.run_in_executor(_CAM_POOL, _encode_jpeg, rgb)
+        except Exception as e:
+            logger.error(f"Error capturing lores image bytes: {e}")
+            return None
+
     def cleanup(self):
         """Clean up camera resources."""
         if self.camera:
@@ -128,16 +229,107 @@ class PiCameraInterface:
         self.is_initialized = False
 
 
+def _encode_jpeg(image: np.ndarray, quality: int = 85) -> Optional[bytes]:
+    """JPEG-encode an image array in memory.
+
+    Args:
+        image: Image array to encode
+        quality: JPEG quality (0-100)
+
+    Returns:
+        Encoded JPEG bytes, or None if encoding failed
+    """
+    if TURBOJPEG_AVAILABLE:
+        return _TURBOJPEG.encode(image, quality=quality)
+
+    if OPENCV_AVAILABLE:
+        success, encoded = cv2.imencode('.jpg', image, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+        return encoded.tobytes() if success else None
+
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, 'JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+def _encode_jpeg_gray(plane: np.ndarray, quality: int = 85) -> Optional[bytes]:
+    """JPEG-encode a single-channel luma plane in memory.
+
+    Args:
+        plane: 2-D uint8 grayscale image
+        quality: JPEG quality (0-100)
+
+    Returns:
+        Encoded JPEG bytes, or None if encoding failed
+    """
+    if TURBOJPEG_AVAILABLE:
+        from turbojpeg import TJPF_GRAY, TJSAMP_GRAY
+        return _TURBOJPEG.encode(plane[:, :, None], quality=quality,
+                                 pixel_format=TJPF_GRAY, jpeg_subsample=TJSAMP_GRAY)
+
+    if OPENCV_AVAILABLE:
+        success, encoded = cv2.imencode('.jpg', plane, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+        return encoded.tobytes() if success else None
+
+    buffer = io.BytesIO()
+    Image.fromarray(plane, mode='L').save(buffer, 'JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+def _build_mock_scene() -> np.ndarray:
+    """Render the static mock-camera scene into a NumPy image buffer.
+
+    The shapes are drawn with vectorized slice/mask assignment instead of
+    per-primitive PIL calls; PIL is only used for the text labels.
+
+    Returns:
+        480x640 RGB image array with the mock objects drawn
+    """
+    height, width = 480, 640
+    img = np.full((height, width, 3), (173, 216, 230), dtype=np.uint8)  # light blue
+
+    # Rectangle (could be a "book") with black outline
+    img[148:252, 98:202] = (0, 0, 0)
+    img[150:250, 100:200] = (139, 69, 19)  # brown
+
+    # Circle (could be a "cup") with black outline
+    yy, xx = np.ogrid[:height, :width]
+    cup_dist = (xx - 340) ** 2 + (yy - 240) ** 2
+    img[cup_dist <= 40 ** 2] = (0, 0, 0)
+    img[cup_dist <= 38 ** 2] = (255, 255, 255)
+
+    # Triangle (could be a "warning sign") with red outline
+    tri = (yy >= 180) & (yy <= 280) & (np.abs(xx - 500) <= (yy - 180) / 2)
+    tri_inner = (yy >= 184) & (yy <= 277) & (np.abs(xx - 500) <= (yy - 184) / 2)
+    img[tri] = (255, 0, 0)
+    img[tri_inner] = (255, 255, 0)  # yellow
+
+    # Static text labels (PIL handles font rendering)
+    image = Image.fromarray(img)
+    draw = ImageDraw.Draw(image)
+    draw.text((120, 200), "BOOK", fill='white')
+    draw.text((320, 240), "CUP", fill='black')
+    draw.text((480, 240), "⚠", fill='red')
+    draw.text((10, height - 30), "Simulated Pi Camera v3 Image", fill='darkblue')
+
+    return np.asarray(image)
+
+
 class MockCameraInterface:
     """Mock camera interface for testing without hardware."""
-    
+
     def __init__(self):
         """Initialize mock camera."""
         self.is_initialized = False
+        self._template = None  # Static scene, rendered once
         logger.info("Initializing Mock Camera interface")
-    
-    def initialize(self) -> bool:
+
+    async def initialize(self) -> bool:
         """Mock initialization - always succeeds."""
+        # The scene is identical across captures; render it once and only
+        # overlay the timestamp per call
+        if self._template is None:
+            self._template = _build_mock_scene()
+
         self.is_initialized = True
         logger.info("✅ Mock Camera initialized")
         return True
@@ -156,45 +348,61 @@ class MockCameraInterface:
                 temp_fd, output_path = tempfile.mkstemp(suffix='.jpg', prefix='parvis_mock_')
                 os.close(temp_fd)
             
-            logger.info(f"Creating mock image: {output_path}")
-            
-            # Create a simple test image
-            width, height = 640, 480
-            image = Image.new('RGB', (width, height), color='lightblue')
-            draw = ImageDraw.Draw(image)
-            
-            # Add some mock objects
-            # Rectangle (could be a "book")
-            draw.rectangle([100, 150, 200, 250], fill='brown', outline='black', width=2)
-            draw.text((120, 200), "BOOK", fill='white')
-            
-            # Circle (could be a "cup")
-            draw.ellipse([300, 200, 380, 280], fill='white', outline='black', width=2)
-            draw.text((320, 240), "CUP", fill='black')
-            
-            # Triangle (could be a "warning sign")
-            draw.polygon([(450, 280), (500, 180), (550, 280)], fill='yellow', outline='red')
-            draw.text((480, 240), "⚠", fill='red')
-            
-            # Add timestamp
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            draw.text((10, 10), f"Mock Camera - {timestamp}", fill='black')
-            draw.text((10, height-30), "Simulated Pi Camera v3 Image", fill='darkblue')
-            
-            # Save image
-            image.save(output_path, 'JPEG', quality=85)
-            
-            # Simulate processing delay
-            await asyncio.sleep(0.5)
-            
-            file_size = os.path.getsize(output_path)
-            logger.info(f"✅ Mock image created successfully ({file_size} bytes)")
+            logger.info("Creating mock image: %s", output_path)
+
+            jpeg = self._render_jpeg()
+            with open(output_path, 'wb') as f:
+                f.write(jpeg)
+
+            logger.info("✅ Mock image created successfully (%d bytes)", len(jpeg))
             return output_path
-            
+
         except Exception as e:
             logger.error(f"Error creating mock image: {e}")
             return None
-    
+
+    async def capture_bytes(self) -> Optional[bytes]:
+        """Create a mock JPEG image in memory.
+
+        Returns:
+            JPEG bytes for the mock scene
+        """
+        try:
+            return self._render_jpeg()
+        except Exception as e:
+            logger.error(f"Error creating mock image bytes: {e}")
+            return None
+
+    async def capture_ndarray(self) -> Optional["np.ndarray"]:
+        """Create a mock frame array without JPEG encoding or disk I/O.
+
+        Returns:
+            RGB frame array for the mock scene
+        """
+        try:
+            return np.asarray(self._render_image())
+        except Exception as e:
+            logger.error(f"Error creating mock frame array: {e}")
+            return None
+
+    def _render_image(self) -> Image.Image:
+        """Render the mock scene with a fresh timestamp."""
+        if self._template is None:
+            self._template = _build_mock_scene()
+
+        image = Image.fromarray(self._template.copy())
+        draw = ImageDraw.Draw(image)
+
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        draw.text((10, 10), f"Mock Camera - {timestamp}", fill='black')
+        return image
+
+    def _render_jpeg(self) -> bytes:
+        """Render the mock scene with a fresh timestamp and JPEG-encode it."""
+        buffer = io.BytesIO()
+        self._render_image().save(buffer, 'JPEG', quality=85)
+        return buffer.getvalue()
+
     def cleanup(self):
         """Mock cleanup."""
         self.is_initialized = False
@@ -208,48 +416,121 @@ class UniversalCameraInterface:
         """Initialize universal camera interface."""
         self.camera = None
         self.is_initialized = False
+
+        # Background reader state (double-buffered latest frame)
+        self._reader_thread = None
+        self._frame_ready = threading.Event()
+        self._buffers = [None, None]
+        self._latest_idx = 0
+
         logger.info("Initializing Universal Camera interface")
-    
-    def initialize(self) -> bool:
+
+    async def initialize(self) -> bool:
         """Initialize any available camera.
-        
+
         Returns:
             True if initialization successful, False otherwise
         """
         if not OPENCV_AVAILABLE:
             logger.error("OpenCV not available - install with: pip install opencv-python")
             return False
-        
+
+        # Device probing blocks on V4L2 opens; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_CAM_POOL, self._initialize_sync)
+
+    def _initialize_sync(self) -> bool:
+        """Probe for a working camera and start the frame reader."""
         try:
             logger.info("Searching for available cameras...")
-            
-            # Try different camera indices
-            for camera_index in range(5):  # Try cameras 0-4
-                try:
-                    camera = cv2.VideoCapture(camera_index)
-                    if camera.isOpened():
-                        # Test capture
-                        ret, frame = camera.read()
-                        if ret and frame is not None:
-                            logger.info(f"✅ Found working camera at index {camera_index}")
-                            self.camera = camera
-                            self.is_initialized = True
-                            return True
-                        else:
-                            camera.release()
-                    else:
-                        camera.release()
-                except Exception as e:
-                    logger.debug(f"Camera {camera_index} failed: {e}")
-                    continue
-            
-            logger.error("No working cameras found")
-            return False
-            
+
+            # Probe all candidate indices in parallel - a failed V4L2 open
+            # can block for seconds, so racing them costs max() not sum()
+            with ThreadPoolExecutor(max_workers=5, thread_name_prefix="cam-probe") as executor:
+                results = list(executor.map(self._probe, range(5)))
+
+            working = [(idx, cam) for idx, cam in results if cam is not None]
+            if not working:
+                logger.error("No working cameras found")
+                return False
+
+            # executor.map preserves order, so the first hit is the lowest index
+            camera_index, self.camera = working[0]
+            for _, camera in working[1:]:
+                camera.release()
+
+            logger.info("✅ Found working camera at index %d", camera_index)
+
+            # MJPG offloads frame decode to libjpeg-turbo and cuts USB bandwidth
+            self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+
+            self._start_reader()
+            self.is_initialized = True
+            return True
+
         except Exception as e:
             logger.error(f"Error initializing camera: {e}")
             return False
-    
+
+    def _probe(self, camera_index: int):
+        """Open and test-capture one camera index.
+
+        Args:
+            camera_index: Device index to probe
+
+        Returns:
+            (camera_index, VideoCapture) on success, (camera_index, None) otherwise
+        """
+        try:
+            # Force V4L2: the default backend can fall back to a slow
+            # userspace YUYV→BGR path on the Pi
+            camera = cv2.VideoCapture(camera_index, cv2.CAP_V4L2)
+            if not camera.isOpened():
+                camera.release()
+                camera = cv2.VideoCapture(camera_index)
+            if camera.isOpened():
+                ret, frame = camera.read()
+                if ret and frame is not None:
+                    return camera_index, camera
+            camera.release()
+        except Exception as e:
+            logger.debug("Camera %d failed: %s", camera_index, e)
+        return camera_index, None
+
+    def _start_reader(self):
+        """Start the background frame reader thread."""
+        # Keep the driver queue shallow; the reader holds the latest frame
+        self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        self._frame_ready.clear()
+        self._reader_thread = threading.Thread(
+            target=self._reader, daemon=True, name="parvis-cam-reader"
+        )
+        self._reader_thread.start()
+
+    def _reader(self):
+        """Continuously grab frames so captures always see the latest one.
+
+        Draining the driver queue in a dedicated thread means capture_image
+        never returns a frame that is several buffers stale.
+        """
+        while self.camera is not None and self._reader_thread is not None:
+            try:
+                if not self.camera.grab():
+                    time.sleep(0.05)
+                    continue
+
+                ret, frame = self.camera.retrieve()
+                if ret and frame is not None:
+                    # Write into the inactive buffer, then publish its index
+                    idx = self._latest_idx ^ 1
+                    self._buffers[idx] = frame
+                    self._latest_idx = idx
+                    self._frame_ready.set()
+            except Exception as e:
+                logger.debug("Frame reader error: %s", e)
+                time.sleep(0.1)
+
     async def capture_image(self, output_path: Optional[str] = None) -> Optional[str]:
         """Capture image from any available camera.
         
@@ -268,62 +549,149 @@ class UniversalCameraInterface:
                 temp_fd, output_path = tempfile.mkstemp(suffix='.jpg', prefix='parvis_camera_')
                 os.close(temp_fd)
             
-            logger.info(f"Capturing image to: {output_path}")
-            
-            # Capture frame
-            ret, frame = self.camera.read()
-            if not ret or frame is None:
-                logger.error("Failed to capture frame")
-                return None
-            
-            # Save image
-            success = cv2.imwrite(output_path, frame)
-            if success:
-                file_size = os.path.getsize(output_path)
-                logger.info(f"✅ Image captured successfully ({file_size} bytes)")
-                return output_path
-            else:
-                logger.error("Failed to save captured image")
+            logger.info("Capturing image to: %s", output_path)
+
+            jpeg = await self.capture_bytes()
+            if jpeg is None:
                 return None
-                
+
+            with open(output_path, 'wb') as f:
+                f.write(jpeg)
+
+            logger.info("✅ Image captured successfully (%d bytes)", len(jpeg))
+            return output_path
+
         except Exception as e:
             logger.error(f"Error capturing image: {e}")
             return None
-    
+
+    async def capture_bytes(self) -> Optional[bytes]:
+        """Capture a JPEG-encoded frame without touching the filesystem.
+
+        Returns:
+            JPEG bytes, or None if capture failed
+        """
+        if not self.is_initialized or not self.camera:
+            logger.error("Camera not initialized")
+            return None
+
+        # The first-frame wait and JPEG encode both block; run them pooled
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_CAM_POOL, self._capture_bytes_sync)
+
+    async def capture_ndarray(self) -> Optional["np.ndarray"]:
+        """Capture a decoded frame array without JPEG encoding or disk I/O.
+
+        Returns:
+            BGR frame array, or None if capture failed
+        """
+        if not self.is_initialized or not self.camera:
+            logger.error("Camera not initialized")
+            return None
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_CAM_POOL, self._latest_frame_sync)
+
+    def _latest_frame_sync(self) -> Optional["np.ndarray"]:
+        """Blocking wait for the latest reader-published frame."""
+        if not self._frame_ready.wait(timeout=2.0):
+            logger.error("Failed to capture frame - no frames produced yet")
+            return None
+        # retrieve() allocates a fresh array per frame, so the published
+        # buffer is never overwritten under the caller
+        return self._buffers[self._latest_idx]
+
+    async def capture_into(self, buf: "np.ndarray") -> bool:
+        """Copy the latest frame into a caller-provided (pooled) buffer.
+
+        Lets callers reuse preallocated buffers downstream instead of
+        holding a fresh per-frame array alive through detection.
+
+        Args:
+            buf: Destination array; must match the frame shape and dtype
+
+        Returns:
+            True if the buffer was filled, False otherwise
+        """
+        frame = await self.capture_ndarray()
+        if frame is None or frame.shape != buf.shape or frame.dtype != buf.dtype:
+            return False
+        np.copyto(buf, frame)
+        return True
+
+    def _capture_bytes_sync(self) -> Optional[bytes]:
+        """Blocking half of capture_bytes (runs on the camera pool)."""
+        try:
+            # Grab the latest frame published by the reader thread
+            if not self._frame_ready.wait(timeout=2.0):
+                logger.error("Failed to capture frame - no frames produced yet")
+                return None
+
+            frame = self._buffers[self._latest_idx]
+            if frame is None:
+                logger.error("Failed to capture frame")
+                return None
+
+            return _encode_jpeg(frame)
+
+        except Exception as e:
+            logger.error(f"Error capturing image bytes: {e}")
+            return None
+
     def cleanup(self):
         """Clean up camera resources."""
+        # Signal the reader thread to exit before releasing the camera
+        reader = self._reader_thread
+        self._reader_thread = None
+        if reader is not None:
+            reader.join(timeout=1.0)
+
         if self.camera:
             try:
                 self.camera.release()
                 logger.info("Universal Camera cleanup complete")
             except Exception as e:
                 logger.error(f"Error during camera cleanup: {e}")
-        
+
         self.camera = None
         self.is_initialized = False
+        self._frame_ready.clear()
+        self._buffers = [None, None]
 
 
-def create_camera_interface(use_mock: bool = False, 
+# Available backends in preference order, resolved once at import.
+# Library availability can't change mid-session, so the factory always
+# picks the same backend instead of re-branching per call.
+_BACKEND_ORDER = tuple(
+    cls for cls, available in (
+        (PiCameraInterface, PICAMERA_AVAILABLE),
+        (UniversalCameraInterface, OPENCV_AVAILABLE),
+        (MockCameraInterface, True),
+    ) if available
+)
+
+
+def create_camera_interface(use_mock: bool = False,
                           prefer_pi_camera: bool = True) -> "CameraInterface":
     """Create appropriate camera interface.
-    
+
     Args:
         use_mock: Force mock camera for testing
         prefer_pi_camera: Prefer Pi Camera over generic cameras
-        
+
     Returns:
         Camera interface instance
     """
     if use_mock:
         return MockCameraInterface()
-    
-    if prefer_pi_camera and PICAMERA_AVAILABLE:
-        return PiCameraInterface()
-    elif OPENCV_AVAILABLE:
-        return UniversalCameraInterface()
-    else:
+
+    order = _BACKEND_ORDER
+    if not prefer_pi_camera:
+        order = tuple(cls for cls in order if cls is not PiCameraInterface)
+
+    if order[0] is MockCameraInterface:
         logger.warning("No camera libraries available, using mock camera")
-        return MockCameraInterface()
+    return order[0]()
 
 
 # Global camera instance
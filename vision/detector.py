@@ -6,26 +6,104 @@ Uses YOLOv8-nano for efficient object detection on Raspberry Pi 4.
 Provides both real detection and mock results for testing.
 """
 
+import ast
+import functools
+import importlib.util
 import logging
+from collections import Counter
+import os
+import platform
+import random
 import time
 import asyncio
-from typing import List, Dict, Tuple, Optional, Any
+from types import MappingProxyType
+from typing import List, Dict, Tuple, Optional, Any, Union
 from pathlib import Path
-import json
+
+# BLAS/OpenMP pools size themselves when torch is first imported (and
+# default to a single thread under some builds), so pin them to the Pi's
+# four cores before ultralytics pulls torch in (lazily, in initialize).
+_NUM_THREADS = str(os.cpu_count() or 4)
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, _NUM_THREADS)
+
+# The ultralytics import drags in ~1s of torch on a Pi; at module load
+# only check that the package exists and defer the import to initialize()
+YOLO_AVAILABLE = importlib.util.find_spec("ultralytics") is not None
 
 try:
-    from ultralytics import YOLO
     import cv2
     import numpy as np
-    YOLO_AVAILABLE = True
+    from . import fast_nms
 except ImportError:
     YOLO_AVAILABLE = False
 
-from PIL import Image
-import tempfile
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# COCO class names that YOLOv8 recognizes, shared across all mock
+# detector instances instead of rebuilt per instance
+_COCO_CLASSES: Tuple[str, ...] = (
+    'person', 'bicycle', 'car', 'motorcycle', 'airplane', 'bus', 'train', 'truck',
+    'boat', 'traffic light', 'fire hydrant', 'stop sign', 'parking meter', 'bench',
+    'bird', 'cat', 'dog', 'horse', 'sheep', 'cow', 'elephant', 'bear', 'zebra',
+    'giraffe', 'backpack', 'umbrella', 'handbag', 'tie', 'suitcase', 'frisbee',
+    'skis', 'snowboard', 'sports ball', 'kite', 'baseball bat', 'baseball glove',
+    'skateboard', 'surfboard', 'tennis racket', 'bottle', 'wine glass', 'cup',
+    'fork', 'knife', 'spoon', 'bowl', 'banana', 'apple', 'sandwich', 'orange',
+    'broccoli', 'carrot', 'hot dog', 'pizza', 'donut', 'cake', 'chair', 'couch',
+    'potted plant', 'bed', 'dining table', 'toilet', 'tv', 'laptop', 'mouse',
+    'remote', 'keyboard', 'cell phone', 'microwave', 'oven', 'toaster', 'sink',
+    'refrigerator', 'book', 'clock', 'vase', 'scissors', 'teddy bear', 'hair drier',
+    'toothbrush'
+)
+
+# Read-only shared name→id map (O(1) lookups, one copy per process)
+_COCO_CLASS_TO_ID = MappingProxyType({name: i for i, name in enumerate(_COCO_CLASSES)})
+
+
+def _cpu_supports_fp16() -> bool:
+    """Check for ARMv8.2 half-precision arithmetic (asimdhp).
+
+    Pi 5's Cortex-A76 has it; Pi 4's Cortex-A72 does not, and running
+    FP16 there would emulate and slow down rather than speed up.
+
+    Returns:
+        True if the CPU executes FP16 natively
+    """
+    if platform.machine() != "aarch64":
+        return False
+    try:
+        with open("/proc/cpuinfo") as f:
+            return "asimdhp" in f.read()
+    except OSError:
+        return False
+
+
+def _dhash64(frame: "np.ndarray") -> int:
+    """Compute a 64-bit difference hash of a frame.
+
+    The frame is downscaled to 9x8 grayscale and each bit records
+    whether a pixel is brighter than its right neighbor. Near-identical
+    frames differ in only a few bits, so a small Hamming distance means
+    the scene has not changed.
+
+    Args:
+        frame: BGR or grayscale image array
+
+    Returns:
+        64-bit hash as an int
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
 
 class DetectionResult:
     """Represents a single object detection result."""
@@ -44,19 +122,57 @@ class DetectionResult:
             class_id: Numeric class ID
         """
         self.class_name = class_name
-        self.confidence = confidence
+        self._confidence = confidence
+        self._score_u8: Optional[int] = None
         self.bbox = bbox  # (x1, y1, x2, y2)
         self.class_id = class_id
-    
+
+    @classmethod
+    def from_quantized(cls,
+                       box_i16: Tuple[int, int, int, int],
+                       score_u8: int,
+                       cls_id: int) -> "DetectionResult":
+        """Build a result from quantized storage.
+
+        Pixel coordinates fit int16 and a spoken confidence never needs
+        more than 1/255 resolution, so quantized results carry 9 bytes of
+        payload instead of 24 - relevant for telemetry logs holding many
+        detections. Dequantization happens lazily on attribute access.
+
+        Args:
+            box_i16: Bounding box (x1, y1, x2, y2) as int16-range pixels
+            score_u8: Confidence quantized to 0-255
+            cls_id: Numeric COCO class ID
+
+        Returns:
+            DetectionResult backed by the quantized values
+        """
+        result = cls.__new__(cls)
+        result.class_name = (
+            _COCO_CLASSES[cls_id] if 0 <= cls_id < len(_COCO_CLASSES) else "unknown"
+        )
+        result._confidence = 0.0
+        result._score_u8 = int(score_u8)
+        result.bbox = tuple(int(v) for v in box_i16)
+        result.class_id = int(cls_id)
+        return result
+
+    @property
+    def confidence(self) -> float:
+        """Detection confidence (0.0-1.0), dequantized if needed."""
+        if self._score_u8 is not None:
+            return self._score_u8 / 255.0
+        return self._confidence
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
+        """Convert to dictionary representation (floats on export)."""
         return {
             'class_name': self.class_name,
             'confidence': self.confidence,
             'bbox': self.bbox,
             'class_id': self.class_id
         }
-    
+
     def __str__(self) -> str:
         """String representation."""
         return f"{self.class_name} ({self.confidence:.2f})"
@@ -65,18 +181,55 @@ class DetectionResult:
 class YOLOv8Detector:
     """YOLOv8-nano object detector optimized for Raspberry Pi 4."""
     
-    def __init__(self, model_name: str = "yolov8n.pt"):
+    def __init__(self, model_name: str = "yolov8n.pt", backend: Optional[str] = None,
+                 quant: Optional[str] = None, calibration_data: str = "coco128.yaml",
+                 imgsz: int = 320, engine_precision: str = "fp16"):
         """Initialize YOLOv8 detector.
-        
+
         Args:
             model_name: YOLOv8 model name (yolov8n.pt for nano)
+            backend: Inference backend ('pytorch', 'ncnn', 'openvino',
+                'onnxruntime' or 'tensorrt'). Defaults to NCNN on ARM
+                (NEON/Winograd kernels, roughly half the latency of the
+                PyTorch path on a Pi 4), PyTorch elsewhere.
+            quant: Optional quantization for the openvino backend
+                ('int8'). INT8 doubles ALU throughput on ARM dot-product
+                units; falls back to FP16 if calibration fails.
+            calibration_data: Dataset yaml used for INT8 calibration
+                (openvino and tensorrt int8 exports)
+            imgsz: Inference input size. Scene description only needs
+                coarse labels, so 320 (a quarter of the FLOPs of the 640
+                default) is the sweet spot on a Pi 4.
+            engine_precision: Precision for the tensorrt backend
+                ('fp32', 'fp16' or 'int8')
         """
         self.model_name = model_name
+        self.imgsz = imgsz
         self.model = None
         self.is_initialized = False
         self.class_names = []
-        
-        logger.info(f"Initializing YOLOv8 detector with model: {model_name}")
+
+        if backend is None:
+            backend = "ncnn" if platform.machine() == "aarch64" else "pytorch"
+        self.backend = backend
+        self.quant = quant
+        self.calibration_data = calibration_data
+        self.engine_precision = engine_precision
+
+        # Micro-batching state, created lazily on first coalesced request
+        self._batch_queue = None
+        self._batch_task = None
+
+        # Optional executor the batch worker runs inference on, so the
+        # coalesced path doesn't block the event loop (set by the owner)
+        self._inference_executor = None
+
+        # Perceptual-hash cache of the last frame's detections
+        self._last_hash = None
+        self._last_detections: List[DetectionResult] = []
+        self._last_ts = 0.0
+
+        logger.info(f"Initializing YOLOv8 detector with model: {model_name} ({self.backend} backend)")
     
     async def initialize(self) -> bool:
         """Initialize YOLOv8 model.
@@ -90,89 +243,581 @@ class YOLOv8Detector:
         
         try:
             logger.info("Loading YOLOv8 model...")
-            
-            # Load model (will download if not present)
-            self.model = YOLO(self.model_name)
-            
-            # Get class names
-            self.class_names = list(self.model.names.values())
+
+            # Deferred heavy import - only detectors that actually run
+            # pay the torch import cost
+            global YOLO
+            from ultralytics import YOLO
+
+            # Conv layers are compute-bound; use all four A72 cores for
+            # intra-op work, one inter-op thread to avoid oversubscription
+            try:
+                import torch
+                torch.set_num_threads(os.cpu_count() or 4)
+                torch.set_num_interop_threads(1)
+            except Exception:
+                pass  # interop count can only be set before parallel work starts
+
+            if self.backend == "ncnn":
+                self.model = self._load_ncnn_model()
+            elif self.backend == "openvino":
+                self.model = self._load_openvino_model()
+            elif self.backend == "onnxruntime":
+                self.model = self._load_onnx_session()
+            elif self.backend == "tensorrt":
+                self.model = self._load_engine_model()
+            else:
+                # Load model (will download if not present)
+                self.model = YOLO(self.model_name)
+
+            # Get class names (ONNX sessions set them during load)
+            if self.backend != "onnxruntime":
+                self.class_names = list(self.model.names.values())
             
             logger.info(f"✅ YOLOv8 model loaded successfully")
             logger.info(f"Model supports {len(self.class_names)} object classes")
             logger.info(f"Sample classes: {self.class_names[:10]}...")
-            
+
+            # First inference triggers lazy kernel selection/autotune and
+            # can run 2-3x slower than steady state; absorb that here so
+            # the first real frame isn't penalized
+            try:
+                dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+                if self.backend == "onnxruntime":
+                    self._detect_onnx(dummy, 1.0, self.imgsz)
+                else:
+                    self.model(dummy, imgsz=self.imgsz, verbose=False)
+                logger.info("Warmup inference complete")
+            except Exception as e:
+                logger.warning(f"Warmup inference failed: {e}")
+
             self.is_initialized = True
             return True
             
         except Exception as e:
             logger.error(f"Failed to initialize YOLOv8: {e}")
             return False
-    
-    async def detect_objects(self, 
-                           image_path: str, 
-                           confidence_threshold: float = 0.25) -> List[DetectionResult]:
+
+    def _load_ncnn_model(self) -> "YOLO":
+        """Load the model through the NCNN backend, exporting once if needed.
+
+        The export is a one-time conversion cached next to the weights
+        (e.g. yolov8n_ncnn_model/); subsequent starts load it directly.
+
+        Returns:
+            YOLO model backed by the exported NCNN weights
+        """
+        stem = Path(self.model_name).with_suffix("")
+        export_dir = stem.parent / f"{stem.name}_ncnn_model"
+
+        if not export_dir.exists():
+            logger.info(f"Exporting {self.model_name} to NCNN (one-time setup)...")
+            YOLO(self.model_name).export(format="ncnn", imgsz=self.imgsz)
+
+        return YOLO(str(export_dir))
+
+    def _load_openvino_model(self) -> "YOLO":
+        """Load the model through OpenVINO, exporting once if needed.
+
+        With quant='int8' the export runs post-training quantization
+        calibrated on `calibration_data`; if calibration fails (e.g.
+        unsupported ops or missing dataset) the export retries at FP16.
+
+        Returns:
+            YOLO model backed by the exported OpenVINO IR
+        """
+        stem = Path(self.model_name).with_suffix("")
+        # Match the exporter's naming: {stem}_int8_openvino_model when
+        # quantized, {stem}_openvino_model otherwise
+        quant_tag = "int8_" if self.quant == "int8" else ""
+        export_dir = stem.parent / f"{stem.name}_{quant_tag}openvino_model"
+
+        if not export_dir.exists():
+            logger.info(f"Exporting {self.model_name} to OpenVINO (one-time setup)...")
+            if self.quant == "int8":
+                try:
+                    YOLO(self.model_name).export(
+                        format="openvino", imgsz=self.imgsz,
+                        int8=True, data=self.calibration_data
+                    )
+                except Exception as e:
+                    logger.warning(f"INT8 calibration failed ({e}), falling back to FP16")
+                    export_dir = stem.parent / f"{stem.name}_openvino_model"
+                    YOLO(self.model_name).export(format="openvino", imgsz=self.imgsz, half=True)
+            else:
+                YOLO(self.model_name).export(format="openvino", imgsz=self.imgsz)
+
+        return YOLO(str(export_dir))
+
+    def _load_engine_model(self) -> "YOLO":
+        """Load the model as a TensorRT engine, exporting once if needed.
+
+        On Jetson-class targets an FP16 engine runs ~3x faster than the
+        PyTorch path and INT8 (with calibration data) up to ~9x. The
+        one-time export can take minutes and is cached as a .engine file
+        next to the weights, keyed by precision.
+
+        Returns:
+            YOLO model backed by the cached TensorRT engine
+        """
+        stem = Path(self.model_name).with_suffix("")
+        engine_path = stem.parent / f"{stem.name}_{self.engine_precision}.engine"
+
+        if not engine_path.exists():
+            logger.info(f"Exporting {self.model_name} to TensorRT "
+                        f"{self.engine_precision} engine (one-time, may take minutes)...")
+            export_start = time.time()
+            exported = YOLO(self.model_name).export(
+                format="engine", imgsz=self.imgsz,
+                half=self.engine_precision == "fp16",
+                int8=self.engine_precision == "int8",
+                data=self.calibration_data if self.engine_precision == "int8" else None,
+                workspace=4
+            )
+            Path(exported).rename(engine_path)
+            logger.info(f"Engine export took {time.time() - export_start:.1f}s")
+
+        return YOLO(str(engine_path), task="detect")
+
+    def _load_onnx_session(self) -> "ort.InferenceSession":
+        """Load an ONNX Runtime session, exporting once if needed.
+
+        Running through ORT directly skips torch's per-call dispatcher
+        overhead; the XNNPACK provider uses NEON GEMM/Winograd kernels
+        on aarch64, with the CPU provider as fallback.
+
+        Returns:
+            Configured ONNX Runtime inference session
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise RuntimeError("onnxruntime not available - install with: pip install onnxruntime")
+
+        onnx_path = Path(self.model_name).with_suffix(".onnx")
+        if not onnx_path.exists():
+            logger.info(f"Exporting {self.model_name} to ONNX (one-time setup)...")
+            # Fixed shape (dynamic=False) lets the runtime pick
+            # shape-specialized kernels; FP16 only where the CPU runs it
+            # natively, since it roughly doubles throughput there but
+            # would emulate (and slow down) on a Pi 4
+            YOLO(self.model_name).export(format="onnx", imgsz=self.imgsz,
+                                         half=_cpu_supports_fp16(), dynamic=False,
+                                         simplify=True, opset=13)
+
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = os.cpu_count() or 4
+        session = ort.InferenceSession(
+            str(onnx_path),
+            sess_options=sess_options,
+            providers=["XnnpackExecutionProvider", "CPUExecutionProvider"]
+        )
+
+        # ultralytics embeds the class-name map in the ONNX metadata
+        meta = session.get_modelmeta().custom_metadata_map
+        if "names" in meta:
+            self.class_names = list(ast.literal_eval(meta["names"]).values())
+        else:
+            self.class_names = list(YOLO(self.model_name).names.values())
+
+        # Reused per-call preprocessing buffers: letterbox canvas and the
+        # NCHW input tensor (float16 for half-precision exports), written
+        # in place each frame instead of allocated fresh
+        self._in_dtype = (np.float16 if "float16" in session.get_inputs()[0].type
+                          else np.float32)
+        self._onnx_canvas = np.empty((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        self._in_buf = np.empty((1, 3, self.imgsz, self.imgsz), dtype=self._in_dtype)
+
+        return session
+
+    def _detect_onnx(self,
+                     image: Union[str, "np.ndarray"],
+                     confidence_threshold: float,
+                     imgsz: int) -> List[DetectionResult]:
+        """Run detection through the ONNX Runtime session.
+
+        Handles the preprocessing ultralytics would otherwise do:
+        letterbox to the model's square input, BGR→RGB, HWC→NCHW float32,
+        then decodes the YOLOv8 head and applies NMS.
+
+        Args:
+            image: Path to an image file or decoded BGR frame
+            confidence_threshold: Minimum confidence for detections
+            imgsz: Model input size
+
+        Returns:
+            List of detection results
+        """
+        frame = cv2.imread(str(image)) if isinstance(image, (str, Path)) else image
+        if frame is None:
+            logger.error("Failed to load image for ONNX inference")
+            return []
+
+        # Letterbox: scale the long side to imgsz, pad the rest with gray
+        height, width = frame.shape[:2]
+        scale = imgsz / max(height, width)
+        new_w, new_h = int(round(width * scale)), int(round(height * scale))
+        pad_x, pad_y = (imgsz - new_w) // 2, (imgsz - new_h) // 2
+
+        if imgsz == self.imgsz:
+            canvas = self._onnx_canvas
+            canvas.fill(114)
+        else:
+            canvas = np.full((imgsz, imgsz, 3), 114, dtype=np.uint8)
+        canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w] = cv2.resize(frame, (new_w, new_h))
+
+        # BGR→RGB + HWC→NCHW as views, normalize straight into the input buffer
+        if imgsz == self.imgsz:
+            np.divide(canvas[:, :, ::-1].transpose(2, 0, 1), 255.0, out=self._in_buf[0])
+            blob = self._in_buf
+        else:
+            blob = (canvas[:, :, ::-1].transpose(2, 0, 1)[None] / 255.0).astype(self._in_dtype)
+
+        input_name = self.model.get_inputs()[0].name
+        preds = self.model.run(None, {input_name: blob})[0][0].T  # (anchors, 4+classes)
+
+        class_scores = preds[:, 4:]
+        clses = class_scores.argmax(axis=1)
+        confs = class_scores[np.arange(len(clses)), clses]
+
+        keep = confs >= confidence_threshold
+        if not keep.any():
+            return []
+
+        boxes_xywh = preds[keep, :4]
+        confs = confs[keep]
+        clses = clses[keep]
+
+        # cv2.dnn.NMSBoxes wants (x, y, w, h) with top-left origin
+        nms_boxes = boxes_xywh.copy()
+        nms_boxes[:, 0] -= nms_boxes[:, 2] / 2
+        nms_boxes[:, 1] -= nms_boxes[:, 3] / 2
+
+        if len(confs) > 500:
+            # Candidate counts this high (e.g. tiled inference) hit the
+            # per-box Python overhead in NMSBoxes; use the compiled kernel
+            xyxy = nms_boxes.copy()
+            xyxy[:, 2] += xyxy[:, 0]
+            xyxy[:, 3] += xyxy[:, 1]
+            indices = fast_nms.nms(xyxy, confs, 0.45)
+        else:
+            indices = cv2.dnn.NMSBoxes(nms_boxes.tolist(), confs.tolist(),
+                                       confidence_threshold, 0.45)
+        if len(indices) == 0:
+            return []
+
+        detections = []
+        for i in np.asarray(indices).flatten():
+            x, y, w, h = nms_boxes[i]
+            # Undo the letterbox to get original-image coordinates
+            x1 = int((x - pad_x) / scale)
+            y1 = int((y - pad_y) / scale)
+            x2 = int((x + w - pad_x) / scale)
+            y2 = int((y + h - pad_y) / scale)
+
+            class_id = int(clses[i])
+            detections.append(DetectionResult(
+                class_name=self.class_names[class_id],
+                confidence=float(confs[i]),
+                bbox=(x1, y1, x2, y2),
+                class_id=class_id
+            ))
+
+        return detections
+
+    async def detect_objects(self,
+                           image: Union[str, "np.ndarray"],
+                           confidence_threshold: float = 0.25,
+                           imgsz: Optional[int] = None) -> List[DetectionResult]:
         """Detect objects in an image.
-        
+
         Args:
-            image_path: Path to image file
+            image: Path to an image file, or an already-decoded frame
+                array (skips the disk write + JPEG decode round trip
+                when the caller holds the capture in memory)
             confidence_threshold: Minimum confidence for detections
-            
+            imgsz: Inference input size (defaults to the detector's imgsz)
+
         Returns:
             List of detection results
         """
+        return self.detect_objects_sync(image, confidence_threshold, imgsz)
+
+    def detect_objects_sync(self,
+                            image: Union[str, "np.ndarray"],
+                            confidence_threshold: float = 0.25,
+                            imgsz: Optional[int] = None) -> List[DetectionResult]:
+        """Blocking detection path, safe to run on a worker thread.
+
+        Inference holds the CPU for tens of milliseconds; callers that
+        care about event-loop latency should run this via an executor
+        instead of awaiting detect_objects on the loop thread.
+
+        Args:
+            image: Path to an image file or a decoded frame array
+            confidence_threshold: Minimum confidence for detections
+            imgsz: Inference input size (defaults to the detector's imgsz)
+
+        Returns:
+            List of detection results
+        """
+        imgsz = imgsz or self.imgsz
         if not self.is_initialized or not self.model:
             logger.error("YOLOv8 detector not initialized")
             return []
-        
-        if not Path(image_path).exists():
-            logger.error(f"Image file not found: {image_path}")
+
+        if isinstance(image, (str, Path)) and not Path(image).exists():
+            logger.error(f"Image file not found: {image}")
             return []
-        
+
         try:
-            logger.info(f"Running object detection on: {image_path}")
+            frame_hash = None
+            if isinstance(image, (str, Path)):
+                logger.debug("Running object detection on: %s", image)
+            else:
+                logger.debug("Running object detection on in-memory frame")
+                frame_hash, cached = self._frame_cache_lookup(image)
+                if cached is not None:
+                    return cached
+
             start_time = time.time()
-            
-            # Run inference
-            results = self.model(image_path, conf=confidence_threshold, verbose=False)
-            
+
+            if self.backend == "onnxruntime":
+                detections = self._detect_onnx(image, confidence_threshold, imgsz)
+            else:
+                # Run inference (ultralytics accepts paths and ndarrays alike).
+                # A spoken scene description never needs more than ~20 boxes,
+                # and capping max_det keeps the O(N²) NMS pass cheap.
+                results = self.model(image, conf=confidence_threshold,
+                                     imgsz=imgsz, iou=0.45, max_det=20,
+                                     agnostic_nms=True, verbose=False)
+                detections = self._parse_result(results[0]) if results else []
+
             detection_time = time.time() - start_time
-            logger.info(f"Detection completed in {detection_time:.2f}s")
-            
-            # Parse results
-            detections = []
-            if results and len(results) > 0:
-                result = results[0]  # First (and only) image
-                
-                if result.boxes is not None:
-                    boxes = result.boxes
-                    
-                    for i in range(len(boxes.xyxy)):
-                        # Extract detection data
-                        bbox = boxes.xyxy[i].cpu().numpy().astype(int)  # [x1, y1, x2, y2]
-                        confidence = float(boxes.conf[i].cpu().numpy())
-                        class_id = int(boxes.cls[i].cpu().numpy())
-                        class_name = self.class_names[class_id]
-                        
-                        detection = DetectionResult(
-                            class_name=class_name,
-                            confidence=confidence,
-                            bbox=tuple(bbox),
-                            class_id=class_id
-                        )
-                        detections.append(detection)
-            
-            logger.info(f"Found {len(detections)} objects:")
-            for detection in detections:
-                logger.info(f"  - {detection}")
-            
+            logger.debug("Detection completed in %.2fs", detection_time)
+
+            self._frame_cache_store(frame_hash, detections)
+
+            logger.info("Found %d objects", len(detections))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Detections: %s", [str(d) for d in detections])
+
             return detections
-            
+
         except Exception as e:
             logger.error(f"Error during object detection: {e}")
             return []
-    
+
+    def _frame_cache_lookup(self,
+                            image: "np.ndarray"
+                            ) -> Tuple[Optional[int], Optional[List[DetectionResult]]]:
+        """Check the unchanged-frame cache for an in-memory frame.
+
+        Consecutive frames of a static scene are near-identical; when the
+        perceptual hash barely moved within the TTL, the previous
+        detections can be reused instead of re-running inference.
+
+        Args:
+            image: Decoded frame array
+
+        Returns:
+            (frame_hash, cached detections) - detections is None on miss
+        """
+        frame_hash = _dhash64(image)
+        if (self._last_hash is not None
+                and time.time() - self._last_ts < 2.0
+                and bin(frame_hash ^ self._last_hash).count("1") <= 4):
+            logger.info("Scene unchanged - reusing cached detections")
+            return frame_hash, list(self._last_detections)
+        return frame_hash, None
+
+    def _frame_cache_store(self,
+                           frame_hash: Optional[int],
+                           detections: List[DetectionResult]) -> None:
+        """Record detections for an in-memory frame's hash.
+
+        Args:
+            frame_hash: Hash from _frame_cache_lookup (None for path inputs)
+            detections: Detections produced for that frame
+        """
+        if frame_hash is not None:
+            self._last_hash = frame_hash
+            self._last_detections = detections
+            self._last_ts = time.time()
+
+    def _parse_result(self, result) -> List[DetectionResult]:
+        """Convert one ultralytics result into DetectionResult objects.
+
+        Args:
+            result: Single ultralytics Results object
+
+        Returns:
+            List of detection results
+        """
+        detections = []
+        if result.boxes is not None:
+            boxes = result.boxes
+
+            # Pull each tensor to host once instead of three syncs per box,
+            # then drop to Python scalars in one vectorized .tolist() pass
+            # rather than converting numpy scalars element by element
+            xyxy = boxes.xyxy.cpu().numpy().astype(np.int32).tolist()
+            confs = boxes.conf.cpu().numpy().tolist()
+            clses = boxes.cls.cpu().numpy().astype(np.int32).tolist()
+
+            detections = [
+                DetectionResult(
+                    class_name=self.class_names[class_id],
+                    confidence=conf,
+                    bbox=tuple(bbox),
+                    class_id=class_id
+                )
+                for bbox, conf, class_id in zip(xyxy, confs, clses)
+            ]
+
+        return detections
+
+    async def detect_objects_batch(self,
+                                 image_paths: List[str],
+                                 confidence_threshold: float = 0.25,
+                                 imgsz: Optional[int] = None) -> List[List[DetectionResult]]:
+        """Detect objects in several images with one model call.
+
+        Per-call overhead (preprocess, Python dispatch) dominates for a
+        nano model, so coalescing close-together requests into one
+        batched forward pass amortizes it.
+
+        Args:
+            image_paths: Paths to image files
+            confidence_threshold: Minimum confidence for detections
+            imgsz: Inference input size (defaults to the detector's imgsz)
+
+        Returns:
+            One detection list per input image, in input order
+        """
+        if not self.is_initialized or not self.model:
+            logger.error("YOLOv8 detector not initialized")
+            return [[] for _ in image_paths]
+
+        imgsz = imgsz or self.imgsz
+        if self._inference_executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._inference_executor,
+                functools.partial(
+                    self._detect_batch_sync, list(image_paths),
+                    confidence_threshold, imgsz
+                )
+            )
+        return self._detect_batch_sync(list(image_paths), confidence_threshold, imgsz)
+
+    def set_inference_executor(self, executor) -> None:
+        """Run batched inference on the given executor.
+
+        Args:
+            executor: Executor the batch worker's blocking model calls
+                should run on (keeps the event loop free)
+        """
+        self._inference_executor = executor
+
+    def _detect_batch_sync(self,
+                           image_paths: List[str],
+                           confidence_threshold: float,
+                           imgsz: int) -> List[List[DetectionResult]]:
+        """Blocking half of detect_objects_batch.
+
+        Args:
+            image_paths: Paths to image files (or decoded frames)
+            confidence_threshold: Minimum confidence for detections
+            imgsz: Inference input size
+
+        Returns:
+            One detection list per input image, in input order
+        """
+        try:
+            if self.backend == "onnxruntime":
+                # The ORT session isn't a callable YOLO object and was
+                # exported with a fixed batch of 1, so run the manual
+                # ONNX path per image instead
+                return [
+                    self._detect_onnx(image, confidence_threshold, imgsz)
+                    for image in image_paths
+                ]
+
+            results = self.model(image_paths, conf=confidence_threshold,
+                                 imgsz=imgsz, iou=0.45, max_det=20,
+                                 agnostic_nms=True, verbose=False)
+            return [self._parse_result(result) for result in results]
+        except Exception as e:
+            logger.error(f"Error during batched object detection: {e}")
+            return [[] for _ in image_paths]
+
+    async def detect_objects_coalesced(self,
+                                     image_path: str,
+                                     confidence_threshold: float = 0.25) -> List[DetectionResult]:
+        """Detect objects, coalescing concurrent requests into micro-batches.
+
+        Requests arriving within a 20 ms window are grouped (max 4) and
+        run as one batched inference; each caller gets back only its own
+        detections.
+
+        Args:
+            image_path: Path to image file
+            confidence_threshold: Minimum confidence for detections
+
+        Returns:
+            List of detection results
+        """
+        # Consult the unchanged-frame cache before enqueueing, so static
+        # scenes skip inference on this path just like the direct one
+        frame_hash = None
+        if not isinstance(image_path, (str, Path)) and image_path is not None:
+            frame_hash, cached = self._frame_cache_lookup(image_path)
+            if cached is not None:
+                return cached
+
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue(maxsize=16)
+            self._batch_task = asyncio.create_task(self._batch_worker())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((image_path, confidence_threshold, future))
+        detections = await future
+        self._frame_cache_store(frame_hash, detections)
+        return detections
+
+    async def _batch_worker(self):
+        """Consume queued detection requests in micro-batches."""
+        while True:
+            batch = [await self._batch_queue.get()]
+
+            # Accumulate up to 3 more requests arriving within 20 ms each
+            while len(batch) < 4:
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout=0.02))
+                except asyncio.TimeoutError:
+                    break
+
+            paths = [path for path, _, _ in batch]
+            # Run at the loosest threshold, then filter per request
+            min_conf = min(conf for _, conf, _ in batch)
+
+            try:
+                all_detections = await self.detect_objects_batch(paths, min_conf)
+                for (_, conf, future), detections in zip(batch, all_detections):
+                    if not future.done():
+                        future.set_result(
+                            [d for d in detections if d.confidence >= conf]
+                        )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
     def cleanup(self):
         """Clean up detector resources."""
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            self._batch_task = None
+            self._batch_queue = None
+
         self.model = None
         self.is_initialized = False
         logger.info("YOLOv8 detector cleanup complete")
@@ -186,22 +831,10 @@ class MockObjectDetector:
         self.model_name = model_name
         self.is_initialized = False
         
-        # Common COCO class names that YOLOv8 recognizes
-        self.class_names = [
-            'person', 'bicycle', 'car', 'motorcycle', 'airplane', 'bus', 'train', 'truck', 
-            'boat', 'traffic light', 'fire hydrant', 'stop sign', 'parking meter', 'bench', 
-            'bird', 'cat', 'dog', 'horse', 'sheep', 'cow', 'elephant', 'bear', 'zebra', 
-            'giraffe', 'backpack', 'umbrella', 'handbag', 'tie', 'suitcase', 'frisbee', 
-            'skis', 'snowboard', 'sports ball', 'kite', 'baseball bat', 'baseball glove', 
-            'skateboard', 'surfboard', 'tennis racket', 'bottle', 'wine glass', 'cup', 
-            'fork', 'knife', 'spoon', 'bowl', 'banana', 'apple', 'sandwich', 'orange', 
-            'broccoli', 'carrot', 'hot dog', 'pizza', 'donut', 'cake', 'chair', 'couch', 
-            'potted plant', 'bed', 'dining table', 'toilet', 'tv', 'laptop', 'mouse', 
-            'remote', 'keyboard', 'cell phone', 'microwave', 'oven', 'toaster', 'sink', 
-            'refrigerator', 'book', 'clock', 'vase', 'scissors', 'teddy bear', 'hair drier', 
-            'toothbrush'
-        ]
-        
+        # Shared module-level COCO class data (interned once per process)
+        self.class_names = _COCO_CLASSES
+        self._class_to_id = _COCO_CLASS_TO_ID
+
         logger.info("Initializing Mock Object Detector")
     
     async def initialize(self) -> bool:
@@ -220,35 +853,50 @@ class MockObjectDetector:
             image_path: Path to image file (used for simulation)
             confidence_threshold: Minimum confidence threshold
             
+        Returns:
+            List of mock detection results
+        """
+        # Simulate processing time, then reuse the synchronous generator
+        await asyncio.sleep(0.5)
+        return self.detect_objects_sync(image_path, confidence_threshold)
+
+    def detect_objects_sync(self,
+                            image_path: Optional[str],
+                            confidence_threshold: float = 0.25) -> List[DetectionResult]:
+        """Generate mock detections without the simulated delay.
+
+        Plain function so fully-mocked pipelines can fabricate results
+        with no event-loop round trips at all.
+
+        Args:
+            image_path: Path to image file, in-memory frame, or None
+            confidence_threshold: Minimum confidence threshold
+
         Returns:
             List of mock detection results
         """
         if not self.is_initialized:
             logger.error("Mock detector not initialized")
             return []
-        
-        logger.info(f"Running mock object detection on: {image_path}")
-        
-        # Simulate processing time
-        await asyncio.sleep(0.5)
-        
+
+        logger.info("Running mock object detection on: %s", image_path)
+
         # Generate realistic mock detections based on image name/type
         detections = []
-        
-        # Analyze image path for context clues
-        image_name = Path(image_path).name.lower()
+
+        # Analyze image path for context clues (in-memory frames have none)
+        image_name = Path(image_path).name.lower() if isinstance(image_path, (str, Path)) else 'mock'
         
         if 'mock' in image_name:
             # For our mock images, return objects that match what we drew
+            # (scores quantized to 0-255: 222≈0.87, 235≈0.92, 194≈0.76)
             detections = [
-                DetectionResult('book', 0.87, (100, 150, 200, 250), 75),
-                DetectionResult('cup', 0.92, (300, 200, 380, 280), 41),
-                DetectionResult('stop sign', 0.76, (450, 180, 550, 280), 11)  # Warning triangle as stop sign
+                DetectionResult.from_quantized((100, 150, 200, 250), 222, 73),   # book
+                DetectionResult.from_quantized((300, 200, 380, 280), 235, 41),   # cup
+                DetectionResult.from_quantized((450, 180, 550, 280), 194, 11)    # warning triangle as stop sign
             ]
         else:
             # For other images, generate random but realistic detections
-            import random
-            
             # Common indoor objects
             common_objects = [
                 ('person', 0.85), ('chair', 0.78), ('laptop', 0.82), ('book', 0.76),
@@ -264,22 +912,24 @@ class MockObjectDetector:
                 # Add some randomness to confidence
                 confidence = base_conf + random.uniform(-0.1, 0.1)
                 confidence = max(confidence_threshold, min(0.95, confidence))
-                
+
                 # Generate random but reasonable bounding box
                 x1 = random.randint(50, 300)
-                y1 = random.randint(50, 200) 
+                y1 = random.randint(50, 200)
                 x2 = x1 + random.randint(80, 200)
                 y2 = y1 + random.randint(60, 150)
-                
-                class_id = self.class_names.index(obj_name) if obj_name in self.class_names else 0
-                
-                detection = DetectionResult(obj_name, confidence, (x1, y1, x2, y2), class_id)
+
+                class_id = self._class_to_id.get(obj_name, 0)
+
+                detection = DetectionResult.from_quantized(
+                    (x1, y1, x2, y2), int(round(confidence * 255)), class_id
+                )
                 detections.append(detection)
         
-        logger.info(f"Mock detection found {len(detections)} objects:")
-        for detection in detections:
-            logger.info(f"  - {detection}")
-        
+        logger.info("Mock detection found %d objects", len(detections))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Detections: %s", [str(d) for d in detections])
+
         return detections
     
     def cleanup(self):
@@ -288,21 +938,26 @@ class MockObjectDetector:
         logger.info("Mock Object Detector cleanup complete")
 
 
-def create_object_detector(use_mock: bool = False, 
-                         model_name: str = "yolov8n.pt") -> "ObjectDetector":
+def create_object_detector(use_mock: bool = False,
+                         model_name: str = "yolov8n.pt",
+                         backend: Optional[str] = None,
+                         engine_precision: str = "fp16") -> "ObjectDetector":
     """Create appropriate object detector.
-    
+
     Args:
         use_mock: Use mock detector for testing
         model_name: YOLOv8 model name
-        
+        backend: Inference backend (see YOLOv8Detector; None auto-selects)
+        engine_precision: Precision for the tensorrt backend
+
     Returns:
         Object detector instance
     """
     if use_mock or not YOLO_AVAILABLE:
         return MockObjectDetector(model_name)
     else:
-        return YOLOv8Detector(model_name)
+        return YOLOv8Detector(model_name, backend=backend,
+                              engine_precision=engine_precision)
 
 
 def format_detections_for_speech(detections: List[DetectionResult]) -> str:
@@ -318,39 +973,74 @@ def format_detections_for_speech(detections: List[DetectionResult]) -> str:
         return "I don't see any recognizable objects in the image."
     
     if len(detections) == 1:
+        # Key the cache on the rendered whole percent, so near-identical
+        # repeat detections share an entry and the spoken text is exactly
+        # what formatting the raw value would produce
         detection = detections[0]
-        return f"I can see a {detection.class_name} with {detection.confidence:.0%} confidence."
-    
-    # Group by class name
-    object_counts = {}
-    for detection in detections:
-        name = detection.class_name
-        if name in object_counts:
-            object_counts[name] += 1
-        else:
-            object_counts[name] = 1
-    
+        return _describe_single(detection.class_name, f"{detection.confidence:.0%}")
+
+    # Group by class name (Counter's C path beats a hand-rolled dict loop),
+    # then format through the memoized helper - repeat scenes (the common
+    # case with a static camera) skip the string building entirely
+    object_counts = Counter(detection.class_name for detection in detections)
+    return _describe(tuple(sorted(object_counts.items())))
+
+
+@functools.lru_cache(maxsize=64)
+def _describe_single(class_name: str, confidence_pct: str) -> str:
+    """Build the spoken description for a lone detection.
+
+    Args:
+        class_name: Detected class name
+        confidence_pct: Rendered whole-percent confidence (the cache key)
+
+    Returns:
+        Human-readable description of the detection
+    """
+    return f"I can see a {class_name} with {confidence_pct} confidence."
+
+
+@functools.lru_cache(maxsize=256)
+def _describe(counts: Tuple[Tuple[str, int], ...]) -> str:
+    """Build the spoken description for a canonicalized label multiset.
+
+    Args:
+        counts: Sorted (class_name, count) pairs
+
+    Returns:
+        Human-readable description of the detected objects
+    """
     # Create description
-    if len(object_counts) == 1:
-        name, count = list(object_counts.items())[0]
+    if len(counts) == 1:
+        name, count = counts[0]
         if count == 1:
             return f"I can see a {name}."
         else:
             return f"I can see {count} {name}s."
-    
+
     # Multiple object types
     items = []
-    for name, count in object_counts.items():
+    for name, count in counts:
         if count == 1:
             items.append(f"a {name}")
         else:
             items.append(f"{count} {name}s")
-    
+
     if len(items) == 2:
         return f"I can see {items[0]} and {items[1]}."
     else:
         return f"I can see {', '.join(items[:-1])}, and {items[-1]}."
 
 
-# Global detector instance
-object_detector = create_object_detector(use_mock=True)  # Default to mock for now
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_object_detector() -> "ObjectDetector":
+    """Get the shared object detector, creating it on first use.
+
+    Constructing at import time would allocate a detector (and on the
+    real path touch YOLO) for anyone importing this module for type
+    hints; the accessor defers that to the first actual use.
+
+    Returns:
+        The process-wide detector instance (mock by default for now)
+    """
+    return create_object_detector(use_mock=True)
\ No newline at end of file
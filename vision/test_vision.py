@@ -26,6 +26,29 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# One pipeline shared by all pipeline-level tests. Re-initializing per
+# test re-pays component construction (and, in real mode, the model
+# weight load); memoizing it amortizes that across the suite.
+_shared_pipeline = None
+
+
+async def _get_pipeline():
+    """Build and initialize the shared mock pipeline on first use.
+
+    Returns:
+        Initialized VisionPipeline, or None if initialization failed
+    """
+    global _shared_pipeline
+    if _shared_pipeline is None:
+        pipeline = VisionPipeline(
+            use_mock_camera=True,
+            use_mock_detector=True,
+            confidence_threshold=0.25
+        )
+        if await pipeline.initialize():
+            _shared_pipeline = pipeline
+    return _shared_pipeline
+
 
 async def test_camera_interface():
     """Test camera interface in mock mode."""
@@ -34,7 +57,7 @@ async def test_camera_interface():
     camera = create_camera_interface(use_mock=True)
     
     # Test initialization
-    success = camera.initialize()
+    success = await camera.initialize()
     if not success:
         print("❌ Camera initialization failed")
         return False
@@ -80,7 +103,7 @@ async def test_object_detector():
     try:
         # Create a temporary mock image first
         camera = create_camera_interface(use_mock=True)
-        camera.initialize()
+        await camera.initialize()
         image_path = await camera.capture_image()
         
         if not image_path:
@@ -110,19 +133,12 @@ async def test_vision_pipeline():
     """Test complete vision pipeline."""
     print("\n🎥 Testing Complete Vision Pipeline (Mock Mode)...")
     
-    # Initialize pipeline with mock components
-    pipeline = VisionPipeline(
-        use_mock_camera=True,
-        use_mock_detector=True,
-        confidence_threshold=0.25
-    )
-    
-    # Test initialization
-    success = await pipeline.initialize()
-    if not success:
+    # Reuse the shared pipeline (initialized once for the whole suite)
+    pipeline = await _get_pipeline()
+    if not pipeline:
         print("❌ Vision pipeline initialization failed")
         return False
-    
+
     print("✅ Vision pipeline initialized successfully")
     
     try:
@@ -152,24 +168,17 @@ async def test_vision_pipeline():
     except Exception as e:
         print(f"❌ Vision pipeline test failed: {e}")
         return False
-    finally:
-        pipeline.cleanup()
 
 
 async def test_multiple_scene_analyses():
     """Test multiple scene analyses for consistency."""
     print("\n🔄 Testing Multiple Scene Analyses...")
     
-    pipeline = VisionPipeline(
-        use_mock_camera=True,
-        use_mock_detector=True,
-        confidence_threshold=0.20
-    )
-    
-    if not await pipeline.initialize():
+    pipeline = await _get_pipeline()
+    if not pipeline:
         print("❌ Pipeline initialization failed")
         return False
-    
+
     successful_analyses = 0
     total_analyses = 5
     
@@ -197,20 +206,17 @@ async def test_multiple_scene_analyses():
     except Exception as e:
         print(f"❌ Multiple analyses test failed: {e}")
         return False
-    finally:
-        pipeline.cleanup()
 
 
 async def test_vision_descriptions():
     """Test different types of vision descriptions."""
     print("\n💬 Testing Vision Description Variations...")
     
-    pipeline = VisionPipeline(use_mock_camera=True, use_mock_detector=True)
-    
-    if not await pipeline.initialize():
+    pipeline = await _get_pipeline()
+    if not pipeline:
         print("❌ Pipeline initialization failed")
         return False
-    
+
     test_prompts = [
         None,  # No prompt
         "Looking around the room,",
@@ -241,8 +247,6 @@ async def test_vision_descriptions():
     except Exception as e:
         print(f"❌ Description test failed: {e}")
         return False
-    finally:
-        pipeline.cleanup()
 
 
 async def main():
@@ -255,26 +259,32 @@ async def main():
     test_results = []
     
     try:
-        # Test 1: Camera Interface
-        camera_success = await test_camera_interface()
-        test_results.append(("Camera Interface", camera_success))
-        
-        # Test 2: Object Detector
-        detector_success = await test_object_detector()
-        test_results.append(("Object Detector", detector_success))
-        
-        # Test 3: Complete Vision Pipeline
-        pipeline_success = await test_vision_pipeline()
-        test_results.append(("Vision Pipeline", pipeline_success))
-        
-        # Test 4: Multiple Analyses
-        multiple_success = await test_multiple_scene_analyses()
-        test_results.append(("Multiple Analyses", multiple_success))
-        
-        # Test 5: Description Variations
-        description_success = await test_vision_descriptions()
-        test_results.append(("Description Variations", description_success))
-        
+        # Build the shared pipeline up front so the gathered tests don't
+        # race to initialize it
+        await _get_pipeline()
+
+        # The five tests are independent (own mock components or the
+        # shared pipeline); running them concurrently overlaps their
+        # simulated capture/detection waits, so wall time tracks the
+        # slowest test instead of the sum
+        concurrent_tests = [
+            ("Camera Interface", test_camera_interface()),
+            ("Object Detector", test_object_detector()),
+            ("Vision Pipeline", test_vision_pipeline()),
+            ("Multiple Analyses", test_multiple_scene_analyses()),
+            ("Description Variations", test_vision_descriptions()),
+        ]
+
+        outcomes = await asyncio.gather(
+            *(coro for _, coro in concurrent_tests),
+            return_exceptions=True
+        )
+
+        for (test_name, _), outcome in zip(concurrent_tests, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"❌ {test_name} raised: {outcome}")
+            test_results.append((test_name, outcome is True))
+
         # Summary
         print("\n" + "=" * 55)
         print("🎯 VISION SYSTEM TEST SUMMARY")
@@ -311,6 +321,10 @@ async def main():
     except Exception as e:
         print(f"\n❌ Test failed with error: {e}")
         logger.exception("Test failed")
+    finally:
+        # Single cleanup for the suite-wide shared pipeline
+        if _shared_pipeline is not None:
+            _shared_pipeline.cleanup()
 
 
 if __name__ == "__main__":